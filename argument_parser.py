@@ -68,4 +68,19 @@ def args_parser():
         help="number of workers (threads) used during downloads (DEFAULT 4).\n",
     )
 
+    parser.add_argument(
+        "-p",
+        "--profile",
+        action="store_true",
+        help="if set, it profiles CPU time and memory allocations of each phase,\n"
+             "saving the stats files in PROFILE_DIR and printing a summary at exit.\n",
+    )
+
+    parser.add_argument(
+        "--profile-dir",
+        default="profile",
+        metavar="PROFILE_DIR",
+        help="directory where the stats files of '--profile' are saved (DEFAULT './profile').\n",
+    )
+
     return parser.parse_args()
@@ -32,6 +32,7 @@ import requests
 import urllib3
 
 from console_manager import console, progress
+from profiler import profile_phase
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
@@ -123,6 +124,10 @@ def copy_url_urllib(task_id: TaskID, url: str, path: str) -> int:
     return response_code
 
 
+@profile_phase(
+    note="Only the main thread is profiled: the time of the download workers "
+         "shows up as waiting time (e.g. 'as_completed', lock acquire)"
+)
 def download(
         urls: List[str], dest_paths: List[str], max_workers: int = 4, verbose: bool = True
 ) -> int:
@@ -0,0 +1,291 @@
+# !/usr/bin/python3
+# -*- coding: utf-8 -*-
+#########################################################
+# {License_info}
+#########################################################
+# @Created By   : Roberto Amoroso
+# @Creation Date: 10/19/2026 10:00
+# @Filename     : profiler.py
+# @Project      : xCited
+#########################################################
+"""
+CPU and memory profiler of the pipeline phases
+"""
+#########################################################
+
+import cProfile
+import fnmatch
+import io
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from functools import partial, wraps
+
+from rich.markdown import Markdown
+
+from console_manager import console, list_elem_symbol
+
+# Output directory of the stats files, None if profiling is disabled
+profile_dir = None
+
+# Stack of the running phases. While a nested phase runs, the outer phase is
+# paused: its elapsed time, peak memory and top functions only cover its own work
+# (only one cProfile can be active at a time anyway). The peak memory of a phase
+# is the memory allocated on top of the one in use when the phase (re)started
+phases_stack = []
+
+# Results of the completed phases, in order of completion
+phases_results = {}
+
+NUM_TOP_FUNCTIONS = 10
+NUM_TOP_ALLOCATIONS = 10
+
+# Files whose allocations are made by the profiler itself (the 're' modules
+# compile the patterns of the tracemalloc filters through 'fnmatch')
+PROFILER_FILES = [
+    __file__,
+    tracemalloc.__file__,
+    pstats.__file__,
+    cProfile.__file__,
+    fnmatch.__file__,
+] + [
+    module.__file__
+    for name, module in list(sys.modules.items())
+    if name in ("re", "sre_compile", "sre_parse") or name.startswith("re._")
+]
+
+
+def profiler_setup(dest_dir):
+    """
+    Enable the profiling of the phases, saving the stats files in 'dest_dir'.
+    If the directory cannot be created, the profiling stays disabled.
+    """
+    global profile_dir
+    dest_dir = os.path.realpath(dest_dir)
+    try:
+        os.makedirs(dest_dir, exist_ok=True)
+    except OSError:
+        console.print(
+            f"The profile directory cannot be created: '{dest_dir}'. Continue without profiling",
+            style="error_style",
+        )
+        return
+    profile_dir = dest_dir
+    tracemalloc.start()
+
+
+def format_size(size):
+    """Return a human readable representation of a size in bytes."""
+    for unit in ["B", "KiB", "MiB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def _pause_phase(phase):
+    phase["profiler"].disable()
+    phase["elapsed"] += time.perf_counter() - phase["segment_start"]
+    phase["peak"] = max(
+        phase["peak"], tracemalloc.get_traced_memory()[1] - phase["segment_memory"]
+    )
+
+
+def _resume_phase(phase):
+    tracemalloc.reset_peak()
+    phase["segment_memory"] = tracemalloc.get_traced_memory()[0]
+    phase["segment_start"] = time.perf_counter()
+    phase["profiler"].enable()
+
+
+def _start_phase(name, note):
+    if phases_stack:
+        outer = phases_stack[-1]
+        _pause_phase(outer)
+        if name not in outer["nested"]:
+            outer["nested"].append(name)
+
+    phase = {
+        "name": name,
+        "profiler": cProfile.Profile(),
+        "elapsed": 0,
+        "peak": 0,
+        "nested": [],
+        "note": note,
+    }
+    phases_stack.append(phase)
+    _resume_phase(phase)
+
+
+def _stop_phase():
+    phase = phases_stack[-1]
+    _pause_phase(phase)
+    phases_stack.pop()
+
+    result = phases_results.setdefault(
+        phase["name"],
+        {
+            "profilers": [],
+            "elapsed": 0,
+            "peak": 0,
+            "nested": [],
+            "allocations": None,
+            "note": phase["note"],
+        },
+    )
+    # The same phase may run more than once: merge the results
+    result["profilers"].append(phase["profiler"])
+    result["elapsed"] += phase["elapsed"]
+    result["peak"] = max(result["peak"], phase["peak"])
+    result["nested"] += [name for name in phase["nested"] if name not in result["nested"]]
+
+    if phases_stack:
+        _resume_phase(phases_stack[-1])
+    else:
+        # Snapshots are expensive on large heaps: take them only once no phase is
+        # being measured, so that their cost never ends up in the reported numbers
+        result["allocations"] = _top_allocations()
+
+
+def _top_allocations():
+    """
+    Return the biggest allocations of the whole live heap (not only the ones of
+    the last phase), ignoring the ones of the profiler.
+    """
+    snapshot = tracemalloc.take_snapshot().filter_traces(
+        [tracemalloc.Filter(False, filename) for filename in PROFILER_FILES]
+    )
+    return snapshot.statistics("lineno")[:NUM_TOP_ALLOCATIONS]
+
+
+def _phase_stats(result):
+    """
+    Merge the cProfile stats of all the runs of a phase, removing the entries of
+    the profiler itself (the decorator wrapper and the enable/disable calls).
+    """
+    stats = pstats.Stats(result["profilers"][0])
+    for profiler in result["profilers"][1:]:
+        stats.add(profiler)
+
+    def is_profiler_entry(func):
+        filename, _, name = func
+        return filename == __file__ or "_lsprof.Profiler" in name
+
+    for func in [func for func in stats.stats if is_profiler_entry(func)]:
+        del stats.stats[func]
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        callers = {caller: value for caller, value in callers.items() if not is_profiler_entry(caller)}
+        stats.stats[func] = (cc, nc, tt, ct, callers)
+
+    stats.total_calls = stats.prim_calls = stats.total_tt = 0
+    stats.get_top_level_stats()
+    return stats
+
+
+def _phase_notes(result):
+    """Return the notes explaining what the numbers of a phase cover."""
+    notes = [result["note"]] if result["note"] else []
+    if result["nested"]:
+        notes.append(
+            "Elapsed time, peak memory and top functions exclude the nested phases: "
+            + ", ".join(result["nested"])
+        )
+    if result["allocations"] is None:
+        notes.append("Top allocations are reported by the enclosing phase")
+    return notes
+
+
+def _dump_phase(name, result, stats):
+    """
+    Save the stats of the phase in '<profile_dir>/<name>.prof' (loadable with
+    pstats or snakeviz) and a human readable report in '<profile_dir>/<name>.txt'.
+    """
+    stats.dump_stats(os.path.join(profile_dir, f"{name}.prof"))
+
+    stream = io.StringIO()
+    stream.write(f"Phase: {name}\n")
+    for note in _phase_notes(result):
+        stream.write(f"Note: {note}\n")
+    stream.write(f"Elapsed time: {result['elapsed']:.2f} sec\n")
+    stream.write(f"Peak memory: {format_size(result['peak'])}\n")
+    if result["allocations"] is not None:
+        stream.write(
+            f"\nTop {NUM_TOP_ALLOCATIONS} allocations of the whole live heap "
+            f"(since the start of the profiling) at the end of the phase:\n"
+        )
+        for stat in result["allocations"]:
+            stream.write(f"\t{stat}\n")
+    stream.write("\n")
+    stats.stream = stream
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats()
+
+    with open(os.path.join(profile_dir, f"{name}.txt"), "w") as dest_file:
+        dest_file.write(stream.getvalue())
+
+
+def profile_phase(func=None, note=None):
+    """
+    Decorator profiling the CPU time (cProfile) and the memory allocations
+    (tracemalloc) of a pipeline phase, named as the decorated function.
+    The optional 'note' is shown in the summary and in the report of the phase.
+
+    NOTES:
+    ------
+    - It does nothing if the profiling has not been enabled with 'profiler_setup'.
+    - cProfile only profiles the calling thread: the time spent by worker threads
+      is shown as waiting time of the main thread.
+    """
+    if func is None:
+        return partial(profile_phase, note=note)
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if profile_dir is None:
+            return func(*args, **kwargs)
+
+        _start_phase(func.__name__, note)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _stop_phase()
+
+    return wrapper
+
+
+def print_profile_summary():
+    """
+    Save the stats files of each phase and print their elapsed time, peak memory
+    and top functions.
+    """
+    if profile_dir is None:
+        return
+
+    console.print("\n", Markdown("\n# Profiling summary"), style="main_style")
+    console.print("{} {:15s}: {}".format(list_elem_symbol, "Stats files", profile_dir))
+
+    for name, result in phases_results.items():
+        stats = _phase_stats(result)
+        _dump_phase(name, result, stats)
+
+        console.print("\n", Markdown(f"## {name}"), style="main_style")
+        for note in _phase_notes(result):
+            console.print("{} {}".format(list_elem_symbol, note), style="warning_style")
+        console.print(
+            "{} {:15s}: {:.2f} sec".format(list_elem_symbol, "Elapsed time", result["elapsed"])
+        )
+        console.print(
+            "{} {:15s}: {}".format(list_elem_symbol, "Peak memory", format_size(result["peak"]))
+        )
+
+        console.print("{} {:15s}:".format(list_elem_symbol, "Top functions"))
+        for func in stats.fcn_list[:NUM_TOP_FUNCTIONS]:
+            _, num_calls, _, cumulative_time, _ = stats.stats[func]
+            console.print(
+                "\t\t{:8.3f} sec {:8d} calls  {}".format(
+                    cumulative_time, num_calls, pstats.func_std_string(func)
+                ),
+                markup=False,
+                highlight=False,
+            )
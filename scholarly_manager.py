@@ -24,8 +24,10 @@ from tqdm import tqdm
 from console_manager import console, list_elem_symbol
 from utils import create_directory, slugify, query_yes_no, ErrorFetchingAuthor
 from downloader import download
+from profiler import profile_phase
 
 
+@profile_phase
 def download_publications_pdf(
         author_id, filled_pubs, max_workers, verbose, dest_base_path="."
 ):
@@ -73,6 +75,7 @@ def download_publications_pdf(
     return eprinted_pubs
 
 
+@profile_phase
 def retrieve_publications_by_author_id(author_id, max_num_pubs=None):
     """
     Notes:
@@ -127,14 +130,20 @@ def retrieve_publications_by_author_id(author_id, max_num_pubs=None):
     return filled_pubs
 
 
+@profile_phase
+def generate_proxy():
+    pg = ProxyGenerator()
+    pg.FreeProxies()
+    scholarly.use_proxy(pg)
+    return pg
+
+
 def proxy_manager():
     if query_yes_no("\nDo you want to use a Proxy? ([italic underline]Recommended[/italic underline])"):
         console.print("\n", Markdown("\n# Generating Proxy"), style="main_style")
         with console.status("[bold green]Looking for a proxy...") as status:  # spinner='material'
             t1 = time.time()
-            pg = ProxyGenerator()
-            pg.FreeProxies()
-            scholarly.use_proxy(pg)
+            pg = generate_proxy()
             t2 = time.time()
 
         console.print(
@@ -19,6 +19,7 @@ from rich.markdown import Markdown
 
 from argument_parser import args_parser
 from console_manager import console_output_setup, console
+from profiler import profiler_setup, print_profile_summary
 from scholarly_manager import (
     proxy_manager,
     download_publications_pdf,
@@ -38,6 +39,10 @@ def main():
         verbose = args.verbose
         num_workers = args.num_workers
 
+        # - Profiler setup
+        if args.profile:
+            profiler_setup(args.profile_dir)
+
         # - Starting xCited program
         console.print(Markdown("# Welcome to xCited!"), style="main_style")
 
@@ -54,6 +59,9 @@ def main():
     except (KeyboardInterrupt, ErrorFetchingAuthor):
         pass
 
+    # - Profiling summary
+    print_profile_summary()
+
     # - Closing xCited
     console.print("\n", Markdown("\n# Closing xCited"), style="main_style")
     sys.exit()